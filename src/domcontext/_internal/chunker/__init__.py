@@ -1,6 +1,6 @@
 """Chunker module for splitting DOM trees into token-aware chunks."""
 
 from .chunk import Chunk
-from .chunker import chunk_tree
+from .chunker import chunk_tree, iter_chunks
 
-__all__ = ["Chunk", "chunk_tree"]
+__all__ = ["Chunk", "chunk_tree", "iter_chunks"]
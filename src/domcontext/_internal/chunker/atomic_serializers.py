@@ -1,7 +1,7 @@
 """Atomic serializers for individual nodes (elements, text)."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Iterator, Tuple
 
 from domnode import Node, Text
 
@@ -11,9 +11,12 @@ class AtomicSerializer(ABC):
 
     Each serializer handles one node and yields individual atoms (attributes/words).
     NO tokenizer - just pure serialization.
+    One serializer is created per node, so the hierarchy uses __slots__.
     """
 
-    def __init__(self, indent: str, node_id: int, path: list):
+    __slots__ = ("indent", "node_id", "path")
+
+    def __init__(self, indent: str, node_id: int, path: Tuple[str, ...]):
         """Initialize serializer with common metadata.
 
         Args:
@@ -43,7 +46,9 @@ class AtomicSerializer(ABC):
 class ElementNoAttrsSerializer(AtomicSerializer):
     """Serializes element without attributes - single atom with no scope."""
 
-    def __init__(self, node: Node, indent: str, node_id: int, path: list):
+    __slots__ = ("node", "base_id")
+
+    def __init__(self, node: Node, indent: str, node_id: int, path: Tuple[str, ...]):
         super().__init__(indent, node_id, path)
         self.node = node
         semantic_id = node.metadata.get("semantic_id")
@@ -68,7 +73,9 @@ class ElementNoAttrsSerializer(AtomicSerializer):
 class ElementSerializer(AtomicSerializer):
     """Serializes element attributes - yields individual attributes."""
 
-    def __init__(self, node: Node, indent: str, node_id: int, path: list):
+    __slots__ = ("node", "base_id")
+
+    def __init__(self, node: Node, indent: str, node_id: int, path: Tuple[str, ...]):
         super().__init__(indent, node_id, path)
         self.node = node
         semantic_id = node.metadata.get("semantic_id")
@@ -106,7 +113,9 @@ class ElementSerializer(AtomicSerializer):
 class TextSerializer(AtomicSerializer):
     """Serializes text - yields individual words."""
 
-    def __init__(self, text: Text, indent: str, node_id: int, path: list):
+    __slots__ = ("text",)
+
+    def __init__(self, text: Text, indent: str, node_id: int, path: Tuple[str, ...]):
         super().__init__(indent, node_id, path)
         self.text = text
 
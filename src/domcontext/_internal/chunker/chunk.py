@@ -1,31 +1,64 @@
 """Chunk container for accumulating text pieces."""
 
-from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 
-@dataclass
 class Chunk:
     """Simple chunk container - just accumulates text and tracks tokens.
 
-    No line-level operations - just stores text pieces.
+    No line-level operations - just stores text pieces and the token count of
+    each. Pieces are only added through add_text, so text and counts stay in step.
     """
 
-    text_pieces: List[str] = field(default_factory=list)
-    _total_tokens: int = field(default=0, init=False, repr=False)
+    __slots__ = ("_pieces", "_piece_tokens", "_total_tokens")
+
+    def __init__(
+        self, text_pieces: Iterable[str] = (), piece_tokens: Optional[Iterable[int]] = None
+    ):
+        """Initialize chunk.
+
+        Args:
+            text_pieces: Initial text pieces
+            piece_tokens: Token count of each initial piece (default: 0 each)
+
+        Raises:
+            ValueError: If piece_tokens and text_pieces differ in length
+        """
+        self._pieces: List[str] = list(text_pieces)
+        if piece_tokens is None:
+            self._piece_tokens: List[int] = [0] * len(self._pieces)
+        else:
+            self._piece_tokens = list(piece_tokens)
+            if len(self._piece_tokens) != len(self._pieces):
+                raise ValueError("piece_tokens must have one count per text piece")
+        self._total_tokens = sum(self._piece_tokens)
+
+    @property
+    def text_pieces(self) -> Tuple[str, ...]:
+        """Text pieces in order (read-only, use add_text to extend)."""
+        return tuple(self._pieces)
 
     def add_text(self, text: str, tokens: int):
         """Add a text piece with its token count."""
-        self.text_pieces.append(text)
+        self._pieces.append(text)
+        self._piece_tokens.append(tokens)
         self._total_tokens += tokens
 
     def get_tokens(self) -> int:
         """Get total tokens (O(1))."""
         return self._total_tokens
 
+    def get_piece_count(self) -> int:
+        """Get number of text pieces (O(1))."""
+        return len(self._pieces)
+
+    def get_piece_tokens(self) -> Tuple[int, ...]:
+        """Get the token count of each text piece, in the order of text_pieces."""
+        return tuple(self._piece_tokens)
+
     def to_markdown(self) -> str:
         """Convert to markdown string."""
-        return "".join(self.text_pieces)  # Just concatenate (newlines already in text)
+        return "".join(self._pieces)  # Just concatenate (newlines already in text)
 
     @property
     def markdown(self) -> str:
@@ -36,3 +69,11 @@ class Chunk:
     def tokens(self) -> int:
         """Backward compatibility: get tokens as property."""
         return self.get_tokens()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self._pieces == other._pieces and self._total_tokens == other._total_tokens
+
+    def __repr__(self) -> str:
+        return f"Chunk(text_pieces={self._pieces!r})"
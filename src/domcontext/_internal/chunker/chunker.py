@@ -1,6 +1,8 @@
 """Main chunking algorithm - builds chunks from flat atom list."""
 
-from typing import List, Optional, Tuple
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from domnode import Node
 
@@ -19,9 +21,6 @@ def chunk_tree(
 ) -> List[Chunk]:
     """Split node tree into chunks with overlap.
 
-    This function processes a flat list of atoms and builds chunks.
-    All grouping and token logic happens here.
-
     Args:
         root: Root node of tree
         tokenizer: Tokenizer for counting tokens
@@ -32,26 +31,66 @@ def chunk_tree(
     Returns:
         List of Chunk objects
     """
+    return list(iter_chunks(root, tokenizer, size, overlap, include_parent_path))
+
+
+def iter_chunks(
+    root: Node,
+    tokenizer: Tokenizer,
+    size: int = 500,
+    overlap: int = 50,
+    include_parent_path: bool = True,
+) -> Iterator[Chunk]:
+    """Split node tree into chunks with overlap, yielding each chunk when complete.
+
+    This function processes a flat list of atoms and builds chunks.
+    All grouping and token logic happens here. Chunks are built lazily, so
+    callers that consume them one at a time never hold the whole list.
+
+    Args:
+        root: Root node of tree
+        tokenizer: Tokenizer for counting tokens
+        size: Target chunk size in tokens
+        overlap: Overlap between chunks in tokens
+        include_parent_path: If True, add parent path (default: True)
+
+    Yields:
+        Chunk objects in document order
+    """
     # Get flat list of atoms (serializer has NO tokenizer!)
     serializer = TreeSerializer(root)
     all_atoms = list(serializer)
 
     if not all_atoms:
-        return []
+        return
+
+    # Parent paths and scope lines repeat across chunks - count each string once
+    count_tokens = _memoize_count_tokens(tokenizer)
+
+    # Fast path: the whole tree fits in one chunk, so skip splitting and overlap
+    single_chunk = _build_single_chunk(all_atoms, size, count_tokens)
+    if single_chunk is not None:
+        yield single_chunk
+        return
+
+    # Prefix sums of per-atom content tokens for overlap, batch-counted on first use
+    token_prefix: Optional[List[int]] = None
 
-    chunks = []
+    is_first_chunk = True
     i = 0  # Current atom index
     prev_chunk_last_node_id: Optional[int] = None  # For continuation detection
 
     while i < len(all_atoms):
         chunk = Chunk()
+        chunk_tokens = 0  # Mirrors chunk.get_tokens() without a method call per check
         chunk_start_idx = i
         atoms_in_chunk = []  # Track which atoms we added
 
         # Add chunk context (parent path) if not first chunk and enabled
-        if chunks and include_parent_path and all_atoms[i].chunk_context:
-            tokens = tokenizer.count_tokens(all_atoms[i].chunk_context)
+        if not is_first_chunk and include_parent_path and all_atoms[i].chunk_context:
+            tokens = count_tokens(all_atoms[i].chunk_context)
             chunk.add_text(all_atoms[i].chunk_context, tokens)
+            chunk_tokens += tokens
 
         # Track current scope state
         current_scope_atoms = []  # Atoms accumulated in current scope
@@ -65,10 +104,11 @@ def chunk_tree(
             if atom.is_first_in_node:
                 # Flush previous scope if any
                 if current_scope_atoms:
-                    line, tokens = _build_and_count(current_scope_atoms, False, False, tokenizer)
-                    if chunk.text_pieces and chunk.get_tokens() + tokens > size:
+                    line, tokens = _build_and_count(current_scope_atoms, False, False, count_tokens)
+                    if chunk.get_piece_count() and chunk_tokens + tokens > size:
                         break
                     chunk.add_text(line, tokens)
+                    chunk_tokens += tokens
                     atoms_in_chunk.extend(current_scope_atoms)
                     current_scope_atoms = []
 
@@ -79,9 +119,9 @@ def chunk_tree(
 
                 # CHECK: Would this atom fit? (worst case with continuation marker)
                 test_line, test_tokens = _build_and_count(
-                    current_scope_atoms, False, not atom.is_last_in_node, tokenizer
+                    current_scope_atoms, False, not atom.is_last_in_node, count_tokens
                 )
-                if chunk.text_pieces and chunk.get_tokens() + test_tokens > size:
+                if chunk.get_piece_count() and chunk_tokens + test_tokens > size:
                     # Won't fit - backtrack
                     i -= 1
                     current_scope_atoms = []
@@ -98,14 +138,17 @@ def chunk_tree(
                     prev_chunk_last_node_id, current_scope_node_id, test_atoms
                 )
                 test_line, test_tokens = _build_and_count(
-                    test_atoms, is_cont, not atom.is_last_in_node, tokenizer
+                    test_atoms, is_cont, not atom.is_last_in_node, count_tokens
                 )
 
                 # Check if fits
-                if chunk.get_tokens() + test_tokens > size and current_scope_atoms:
+                if chunk_tokens + test_tokens > size and current_scope_atoms:
                     # Doesn't fit - close current scope with continuation
-                    line, tokens = _build_and_count(current_scope_atoms, is_cont, True, tokenizer)
+                    line, tokens = _build_and_count(
+                        current_scope_atoms, is_cont, True, count_tokens
+                    )
                     chunk.add_text(line, tokens)
+                    chunk_tokens += tokens
                     atoms_in_chunk.extend(current_scope_atoms)
                     current_scope_atoms = []
                     break
@@ -119,8 +162,9 @@ def chunk_tree(
                 is_cont = _is_continuation(
                     prev_chunk_last_node_id, current_scope_node_id, current_scope_atoms
                 )
-                line, tokens = _build_and_count(current_scope_atoms, is_cont, False, tokenizer)
+                line, tokens = _build_and_count(current_scope_atoms, is_cont, False, count_tokens)
                 chunk.add_text(line, tokens)
+                chunk_tokens += tokens
                 atoms_in_chunk.extend(current_scope_atoms)
                 current_scope_atoms = []
 
@@ -129,14 +173,16 @@ def chunk_tree(
             is_cont = _is_continuation(
                 prev_chunk_last_node_id, current_scope_node_id, current_scope_atoms
             )
-            line, tokens = _build_and_count(current_scope_atoms, is_cont, True, tokenizer)
+            line, tokens = _build_and_count(current_scope_atoms, is_cont, True, count_tokens)
 
             # Force add if chunk is empty, otherwise check if fits
-            if not chunk.text_pieces:
+            if not chunk.get_piece_count():
                 chunk.add_text(line, tokens)
+                chunk_tokens += tokens
                 atoms_in_chunk.extend(current_scope_atoms)
-            elif chunk.get_tokens() + tokens <= size:
+            elif chunk_tokens + tokens <= size:
                 chunk.add_text(line, tokens)
+                chunk_tokens += tokens
                 atoms_in_chunk.extend(current_scope_atoms)
             else:
                 # Doesn't fit - backtrack
@@ -145,8 +191,9 @@ def chunk_tree(
         # SAFETY: If no content atoms were added (only parent path), force add at least one
         if not atoms_in_chunk and i < len(all_atoms):
             atom = all_atoms[i]
-            line, tokens = _build_and_count([atom], False, not atom.is_last_in_node, tokenizer)
+            line, tokens = _build_and_count([atom], False, not atom.is_last_in_node, count_tokens)
             chunk.add_text(line, tokens)
+            chunk_tokens += tokens
             atoms_in_chunk.append(atom)
             i += 1
 
@@ -154,13 +201,14 @@ def chunk_tree(
         if atoms_in_chunk:
             prev_chunk_last_node_id = atoms_in_chunk[-1].node_id
 
-        chunks.append(chunk)
+        yield chunk
+        is_first_chunk = False
 
         # Handle overlap - simple index backtracking!
         if i < len(all_atoms):
-            overlap_start = _calculate_overlap_start(
-                all_atoms, chunk_start_idx, i, overlap, tokenizer
-            )
+            if token_prefix is None:
+                token_prefix = list(accumulate(_count_atom_tokens(all_atoms, tokenizer), initial=0))
+            overlap_start = _calculate_overlap_start(token_prefix, chunk_start_idx, i, overlap)
             if overlap_start > chunk_start_idx:
                 i = overlap_start
                 # Update continuation tracking
@@ -168,7 +216,60 @@ def chunk_tree(
                     prev_chunk_last_node_id = all_atoms[overlap_start - 1].node_id
             # Otherwise continue from current position
 
-    return chunks
+
+def _memoize_count_tokens(tokenizer: Tokenizer) -> Callable[[str], int]:
+    """Wrap tokenizer.count_tokens with a cache scoped to one chunking run."""
+    cache: Dict[str, int] = {}
+    count = tokenizer.count_tokens
+
+    def count_tokens(text: str) -> int:
+        tokens = cache.get(text)
+        if tokens is None:
+            tokens = cache[text] = count(text)
+        return tokens
+
+    return count_tokens
+
+
+def _build_single_chunk(
+    atoms: List[Atom], size: int, count_tokens: Callable[[str], int]
+) -> Optional[Chunk]:
+    """Build one chunk with every node's complete line, if the total fits in size.
+
+    Stops as soon as the running total exceeds size, so trees that need
+    splitting only pay for about one chunk's worth of lines (and those counts
+    are memoized for the main loop).
+
+    Returns:
+        The single chunk, or None if the tree does not fit
+    """
+    chunk = Chunk()
+    total = 0
+    scope_start = 0
+
+    for scope_end, atom in enumerate(atoms, 1):
+        if atom.is_last_in_node:
+            line, tokens = _build_and_count(
+                atoms[scope_start:scope_end], False, False, count_tokens
+            )
+            total += tokens
+            if total > size:
+                return None
+            chunk.add_text(line, tokens)
+            scope_start = scope_end
+
+    return chunk
+
+
+def _count_atom_tokens(atoms: List[Atom], tokenizer: Tokenizer) -> List[int]:
+    """Count tokens for every atom's content with a single batch call.
+
+    Contents repeat a lot (every element atom is ""), so each distinct
+    string is sent to the tokenizer once.
+    """
+    unique = list(dict.fromkeys(atom.content for atom in atoms))
+    counts = dict(zip(unique, tokenizer.count_tokens_batch(unique)))
+    return [counts[atom.content] for atom in atoms]
 
 
 def _is_continuation(
@@ -179,7 +280,10 @@ def _is_continuation(
 
 
 def _build_and_count(
-    atoms: List[Atom], is_continuation: bool, has_more: bool, tokenizer: Tokenizer
+    atoms: List[Atom],
+    is_continuation: bool,
+    has_more: bool,
+    count_tokens: Callable[[str], int],
 ) -> Tuple[str, int]:
     """Build a scope line and count its tokens.
 
@@ -187,7 +291,7 @@ def _build_and_count(
         Tuple of (line, token_count)
     """
     line = _build_scope_line(atoms, is_continuation, has_more)
-    tokens = tokenizer.count_tokens(line)
+    tokens = count_tokens(line)
     return line, tokens
 
 
@@ -232,22 +336,23 @@ def _build_scope_line(atoms: List[Atom], is_continuation: bool, has_more: bool)
 
 
 def _calculate_overlap_start(
-    all_atoms: List[Atom],
+    token_prefix: List[int],
     chunk_start: int,
     chunk_end: int,
     overlap_tokens: int,
-    tokenizer: Tokenizer,
 ) -> int:
     """Calculate where next chunk should start based on overlap.
 
-    Simple index backtracking based on token budget.
+    Finds the longest run of atoms ending at chunk_end whose content fits in
+    the overlap budget. Token counts are non-negative, so prefix sums are
+    sorted and the start can be binary-searched.
 
     Args:
-        all_atoms: List of all atoms
+        token_prefix: Prefix sums of atom content tokens (token_prefix[i] is
+            the total for atoms before index i)
         chunk_start: Where current chunk started
         chunk_end: Where current chunk ended
         overlap_tokens: Target overlap size
-        tokenizer: Tokenizer for counting
 
     Returns:
         Index where next chunk should start
@@ -255,19 +360,10 @@ def _calculate_overlap_start(
     if chunk_start >= chunk_end:
         return chunk_end
 
-    # Count backwards to find overlap point
-    accumulated = 0
-    overlap_count = 0
-
-    for i in range(chunk_end - 1, chunk_start - 1, -1):
-        atom = all_atoms[i]
-        # Estimate tokens for this atom (just content)
-        atom_tokens = tokenizer.count_tokens(atom.content)
-
-        if accumulated + atom_tokens > overlap_tokens:
-            break
-
-        accumulated += atom_tokens
-        overlap_count += 1
+    # Fast path: the last atom alone exceeds the budget, so nothing overlaps
+    if token_prefix[chunk_end] - token_prefix[chunk_end - 1] > overlap_tokens:
+        return chunk_end
 
-    return max(chunk_end - overlap_count, chunk_start)
+    # Earliest start whose suffix up to chunk_end stays within the budget
+    target = token_prefix[chunk_end] - overlap_tokens
+    return bisect_left(token_prefix, target, chunk_start, chunk_end)
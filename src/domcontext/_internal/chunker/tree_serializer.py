@@ -1,9 +1,10 @@
 """TreeSerializer - orchestrates serialization of entire Node tree."""
 
-from typing import Iterator, List, Tuple
+from typing import Iterator, Tuple
 
 from domnode import Node, Text
 
+from ..serializer import get_indent
 from .atomic_serializers import ElementNoAttrsSerializer, ElementSerializer, TextSerializer
 from .types import Atom
 
@@ -26,21 +27,12 @@ class TreeSerializer:
 
     def __iter__(self) -> Iterator[Atom]:
         """Yield atoms from DFS traversal of node tree."""
-        for node, depth, path in self._dfs_with_path(self.root):
+        for node, depth, path, chunk_context in self._dfs_with_path(self.root):
             node_id = self.node_counter
             self.node_counter += 1
 
-            # Build chunk_context (formatted parent path)
-            chunk_context = ""
-            if path:
-                lines = []
-                for depth_idx, ancestor_id in enumerate(path):
-                    ancestor_indent = "  " * depth_idx
-                    lines.append(f"{ancestor_indent}- {ancestor_id}\n")
-                chunk_context = "".join(lines)
-
             # Create appropriate serializer based on node type
-            indent = "  " * depth
+            indent = get_indent(depth)
             serializer = self._create_serializer(node, indent, node_id, path)
 
             # Yield atoms from this serializer
@@ -66,34 +58,36 @@ class TreeSerializer:
                     is_last_in_node=is_last,
                 )
 
-    def _dfs_with_path(self, root: Node) -> Iterator[Tuple[Node | Text, int, List[str]]]:
-        """DFS traversal with depth and path tracking.
+    def _dfs_with_path(self, root: Node) -> Iterator[Tuple[Node | Text, int, Tuple[str, ...], str]]:
+        """DFS traversal with depth, path and chunk context tracking.
 
         Yields:
-            (node, depth, path) where path is list of ancestor semantic IDs
+            (node, depth, path, chunk_context) where path is a tuple of ancestor
+            semantic IDs and chunk_context is that path formatted as markdown
+            lines (e.g. "- body-1\n  - div-1\n")
         """
-
-        def traverse(node: Node | Text, depth: int = 0, path: List[str] = None):
-            if path is None:
-                path = []
+        # Pre-order DFS
+        stack = [(root, 0, (), "")]
+        while stack:
+            node, depth, path, chunk_context = stack.pop()
 
             # Yield this node
-            yield (node, depth, path)
+            yield (node, depth, path, chunk_context)
 
-            # For Node, traverse children
+            # For Node, queue children
             if isinstance(node, Node):
-                # Build path for children
+                # Extend path and context once per element (shared by all children)
                 semantic_id = node.metadata.get("semantic_id")
                 node_id = semantic_id if semantic_id else node.tag
-                new_path = path + [node_id]
-
-                # Traverse children
-                for child in node.children:
-                    yield from traverse(child, depth + 1, new_path)
+                child_path = path + (node_id,)
+                child_context = f"{chunk_context}{get_indent(depth)}- {node_id}\n"
 
-        yield from traverse(root, 0, [])
+                for child in reversed(node.children):
+                    stack.append((child, depth + 1, child_path, child_context))
 
-    def _create_serializer(self, node: Node | Text, indent: str, node_id: int, path: list):
+    def _create_serializer(
+        self, node: Node | Text, indent: str, node_id: int, path: Tuple[str, ...]
+    ):
         """Factory: create appropriate serializer based on node type."""
         if isinstance(node, Node):
             if node.attrib:
@@ -9,8 +9,22 @@ class Atom:
 
     Each atom carries pre-formatted text for different contexts.
     The chunker decides which text to use based on chunk/line state.
+
+    One atom is created per attribute/word, so instances use __slots__.
     """
 
+    __slots__ = (
+        "content",
+        "chunk_context",
+        "line_start_first",
+        "line_start_cont",
+        "line_end_complete",
+        "line_end_cont",
+        "node_id",
+        "is_first_in_node",
+        "is_last_in_node",
+    )
+
     content: str  # Just the atom: 'type="submit"' or 'hello'
 
     # Chunk level - parent path to show when starting new chunk
@@ -3,20 +3,46 @@
 Adds semantic IDs and preserves original node references during filtering.
 """
 
-from typing import Dict, Optional, Tuple
+import sys
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, Optional, Tuple
 
-from domnode import Node, Text, filter_visible, filter_semantic
+from domnode import Node, Text
+from domnode.filters import visibility
 from domnode.filters.semantic import (
-    filter_attributes,
-    filter_empty,
-    filter_presentational_roles,
+    SEMANTIC_ATTRIBUTES,
     collapse_single_child_wrappers,
+    filter_empty,
 )
 
+# Tags that never render (kept in sync with domnode's visibility filter)
+NON_VISIBLE_TAGS: FrozenSet[str] = frozenset(visibility.NON_VISIBLE_TAGS)
+
+
+def _copy_node(node: Node, original: Node, share_dicts: bool = False) -> Node:
+    """Copy a single node (without children), recording its original node.
+
+    With share_dicts, the copy reuses the source's attrib and styles dicts
+    instead of copying them (only for callers that never mutate them in place).
+    """
+    # Parsers create a fresh tag string per element; interning makes every copy
+    # share one object per tag name
+    new_node = Node(
+        tag=sys.intern(node.tag),
+        attrib=node.attrib if share_dicts else dict(node.attrib),
+        styles=node.styles if share_dicts else dict(node.styles),
+        bounds=node.bounds,
+        metadata=dict(node.metadata),
+    )
+    new_node.metadata["original_node"] = original
+    return new_node
+
 
 def deep_copy_with_metadata(node: Node, original: Optional[Node] = None) -> Node:
     """Deep copy a node tree, preserving metadata and original node reference.
 
+    Uses an explicit stack, so deep trees do not hit the recursion limit.
+
     Args:
         node: Node to copy
         original: Original node to reference (if this is a filtered copy)
@@ -24,30 +50,152 @@ def deep_copy_with_metadata(node: Node, original: Optional[Node] = None) -> Node
     Returns:
         Deep copy of node with original_node in metadata
     """
-    # Create new node with same data
-    new_node = Node(
-        tag=node.tag,
-        attrib=dict(node.attrib),
-        styles=dict(node.styles),
-        bounds=node.bounds,
-        metadata=dict(node.metadata),
-    )
+    new_root = _copy_node(node, original if original is not None else node)
 
-    # Store original node reference
-    if original is not None:
-        new_node.metadata["original_node"] = original
-    else:
-        new_node.metadata["original_node"] = node
+    stack = [(node, new_root)]
+    while stack:
+        source, target = stack.pop()
+
+        # Copy children in order; element children are expanded later
+        for child in source.children:
+            if isinstance(child, Node):
+                child_copy = _copy_node(child, child)
+                target.append(child_copy)
+                stack.append((child, child_copy))
+            elif isinstance(child, Text):
+                target.append(Text(child.content))
 
-    # Deep copy children
-    for child in node.children:
-        if isinstance(child, Node):
-            child_copy = deep_copy_with_metadata(child, child if original is None else None)
-            new_node.append(child_copy)
-        elif isinstance(child, Text):
-            new_node.append(Text(child.content))
+    return new_root
 
-    return new_node
+
+@lru_cache(maxsize=4096)
+def _is_hidden_style(display: str, visibility: str, opacity: str) -> bool:
+    """Check computed style values for display:none, visibility:hidden, opacity:0.
+
+    Cached by raw style strings - pages repeat a small set of values.
+    """
+    if display.lower() == "none":
+        return True
+    if visibility.lower() == "hidden":
+        return True
+    try:
+        return float(opacity) == 0
+    except (ValueError, TypeError):
+        return False
+
+
+def _is_css_hidden(node: Node) -> bool:
+    """Check if element is hidden by CSS, hidden attribute, or as a hidden input."""
+    styles = node.styles
+    if _is_hidden_style(
+        styles.get("display", ""), styles.get("visibility", ""), styles.get("opacity", "1")
+    ):
+        return True
+
+    if "hidden" in node.attrib:
+        return True
+    return node.tag == "input" and node.attrib.get("type", "").lower() == "hidden"
+
+
+def _has_zero_size(node: Node) -> bool:
+    """Check if element has zero width or height."""
+    bounds = node.bounds
+    return bool(bounds) and (bounds.width == 0 or bounds.height == 0)
+
+
+def filter_visibility(
+    node: Node,
+    non_visible_tags: bool = True,
+    css_hidden: bool = True,
+    zero_dimensions: bool = True,
+) -> Optional[Node]:
+    """Apply the enabled visibility filters in a single traversal.
+
+    Equivalent to running domnode's filter_non_visible_tags, filter_css_hidden
+    and filter_zero_dimensions in sequence, but copies the tree only once and
+    never descends into subtrees that are dropped. Copies record original_node
+    in metadata like deep_copy_with_metadata, but share attrib and styles dicts
+    with the input - the pipeline replaces these dicts rather than mutating them.
+
+    Args:
+        node: Node to filter
+        non_visible_tags: Remove script, style, head tags
+        css_hidden: Remove display:none, visibility:hidden elements
+        zero_dimensions: Remove zero-dimension elements (unless they have visible children)
+
+    Returns:
+        Filtered copy of the tree with original_node references in metadata,
+        or None if the root itself is removed
+    """
+    non_visible = NON_VISIBLE_TAGS if non_visible_tags else frozenset()
+
+    def is_removed(n: Node) -> bool:
+        return n.tag in non_visible or (css_hidden and _is_css_hidden(n))
+
+    if is_removed(node):
+        return None
+
+    def copy(n: Node) -> Node:
+        # Keep an existing original_node reference, otherwise point at the source
+        return _copy_node(n, n.metadata.get("original_node", n), share_dicts=True)
+
+    # Top-down pass: copy surviving nodes (every copy is recorded after its parent)
+    new_root = copy(node)
+    order = [new_root]
+    stack = [(node, new_root)]
+    while stack:
+        source, target = stack.pop()
+        for child in source.children:
+            if isinstance(child, Node):
+                if is_removed(child):
+                    continue
+                child_copy = copy(child)
+                target.append(child_copy)
+                order.append(child_copy)
+                stack.append((child, child_copy))
+            elif isinstance(child, Text):
+                target.append(Text(child.content))
+
+    if not zero_dimensions:
+        return new_root
+
+    # Bottom-up pass: drop zero-size elements that have no element children left
+    removed = set()
+    for n in reversed(order):
+        if removed and any(id(c) in removed for c in n.children):
+            n.children = [c for c in n.children if id(c) not in removed]
+        if _has_zero_size(n) and not any(isinstance(c, Node) for c in n.children):
+            removed.add(id(n))
+
+    return None if id(new_root) in removed else new_root
+
+
+def clean_attributes_in_place(node: Node, keep: Optional[AbstractSet[str]] = None) -> None:
+    """Filter attributes and presentational roles in place.
+
+    Same result as domnode's filter_attributes (when keep is given) followed by
+    filter_presentational_roles, without cloning the tree twice. Only use on
+    trees owned by the caller - attrib dicts are replaced, never mutated.
+
+    Args:
+        node: Root of tree to clean
+        keep: Attributes to keep (None keeps all attributes)
+    """
+    stack = [node]
+    while stack:
+        n = stack.pop()
+
+        # Reuse the dict when nothing is dropped
+        attrib = n.attrib
+        if keep is not None and not keep.issuperset(attrib):
+            attrib = {k: v for k, v in attrib.items() if k in keep}
+
+        # role="none"/"presentation" carries no meaning
+        if attrib.get("role", "").lower() in ("none", "presentation"):
+            attrib = {k: v for k, v in attrib.items() if k != "role"}
+
+        n.attrib = attrib
+        stack.extend(child for child in n.children if isinstance(child, Node))
 
 
 def apply_filters_with_original(
@@ -73,25 +221,23 @@ def apply_filters_with_original(
     Returns:
         Filtered node tree with original_node references in metadata
     """
-    # First, deep copy to preserve original
-    filtered = deep_copy_with_metadata(node)
-
-    # Apply visibility filters
+    # Copy to preserve original - the visibility filters (fused into one
+    # traversal) copy only what survives, so hidden subtrees are never copied
     if filter_non_visible_tags or filter_css_hidden or filter_zero_dimensions:
-        filtered = filter_visible(filtered)
-        if filtered is None:
-            return None
-
-    # Apply semantic filters
-    if filter_attributes_flag:
-        filtered = filter_attributes(filtered)
+        filtered = filter_visibility(
+            node,
+            non_visible_tags=filter_non_visible_tags,
+            css_hidden=filter_css_hidden,
+            zero_dimensions=filter_zero_dimensions,
+        )
         if filtered is None:
             return None
+    else:
+        filtered = deep_copy_with_metadata(node)
 
-    # Always filter presentational roles
-    filtered = filter_presentational_roles(filtered)
-    if filtered is None:
-        return None
+    # Apply semantic filters - attribute filtering and (always) presentational
+    # roles run in place, since the copy above is private
+    clean_attributes_in_place(filtered, SEMANTIC_ATTRIBUTES if filter_attributes_flag else None)
 
     if filter_empty_flag:
         filtered = filter_empty(filtered)
@@ -110,6 +256,7 @@ def generate_semantic_ids(node: Node) -> Tuple[Node, Dict[str, Node]]:
     """Generate semantic IDs for all element nodes.
 
     Generates readable IDs like "button-1", "input-2", "div-3" for LLM context.
+    Also copies backend_node_id from the original node into each node's metadata.
 
     Args:
         node: Root node of tree
@@ -120,23 +267,28 @@ def generate_semantic_ids(node: Node) -> Tuple[Node, Dict[str, Node]]:
     tag_counts: Dict[str, int] = {}
     id_mapping: Dict[str, Node] = {}
 
-    def traverse(n: Node) -> None:
-        """Recursively traverse and assign IDs."""
+    # Pre-order DFS
+    stack = [node]
+    while stack:
+        n = stack.pop()
+
         # Count this tag
         tag = n.tag
-        if tag not in tag_counts:
-            tag_counts[tag] = 0
-        tag_counts[tag] += 1
+        tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
         # Generate ID
         semantic_id = f"{tag}-{tag_counts[tag]}"
         n.metadata["semantic_id"] = semantic_id
         id_mapping[semantic_id] = n
 
-        # Traverse children
-        for child in n.children:
+        # Resolve backend node ID from original node once (flat lookup later)
+        original = n.metadata.get("original_node")
+        if original is not None:
+            n.metadata["backend_node_id"] = original.metadata.get("backend_node_id")
+
+        # Queue element children
+        for child in reversed(n.children):
             if isinstance(child, Node):
-                traverse(child)
+                stack.append(child)
 
-    traverse(node)
     return node, id_mapping
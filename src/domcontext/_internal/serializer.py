@@ -1,7 +1,20 @@
 """Serialization for domnode trees to markdown format."""
 
+from io import StringIO
+from typing import List
+
 from domnode import Node, Text
 
+# Indent strings by depth, extended on demand
+_INDENT_CACHE: List[str] = [""]
+
+
+def get_indent(depth: int) -> str:
+    """Return the indent string for a depth (two spaces per level)."""
+    while len(_INDENT_CACHE) <= depth:
+        _INDENT_CACHE.append(_INDENT_CACHE[-1] + "  ")
+    return _INDENT_CACHE[depth]
+
 
 def serialize_to_markdown(node: Node) -> str:
     """Serialize domnode tree to markdown bullet list format.
@@ -18,36 +31,37 @@ def serialize_to_markdown(node: Node) -> str:
             - a-1
               - "About"
     """
-    lines = []
+    buf = StringIO()
+    write = buf.write
 
-    def traverse(n: Node, depth: int = 0):
-        """Recursively traverse and build markdown."""
-        indent = "  " * depth
+    # Pre-order DFS
+    stack = [(node, 0)]
+    while stack:
+        n, depth = stack.pop()
+        indent = get_indent(depth)
+
+        # Lines are newline-separated, with no trailing newline
+        if buf.tell():
+            write("\n")
+
+        # Add text nodes as quoted strings
+        if isinstance(n, Text):
+            write(f'{indent}- "{n.content}"')
+            continue
 
         # Get semantic ID or fallback to tag
         semantic_id = n.metadata.get("semantic_id", n.tag)
 
-        # Format attributes
-        attr_parts = []
+        # Build line (attributes joined once, in insertion order)
         if n.attrib:
-            attr_strs = [f'{k}="{v}"' for k, v in n.attrib.items()]
-            attr_parts.append(f'({" ".join(attr_strs)})')
-
-        # Build line
-        markdown = f"{semantic_id}"
-        if attr_parts:
-            markdown += f" {' '.join(attr_parts)}"
-
-        lines.append(f"{indent}- {markdown}")
-
-        # Process children
-        for child in n.children:
-            if isinstance(child, Node):
-                traverse(child, depth + 1)
-            elif isinstance(child, Text):
-                # Add text nodes as quoted strings
-                text_indent = "  " * (depth + 1)
-                lines.append(f'{text_indent}- "{child.content}"')
-
-    traverse(node, 0)
-    return "\n".join(lines)
+            attrs = " ".join([f'{k}="{v}"' for k, v in n.attrib.items()])
+            write(f"{indent}- {semantic_id} ({attrs})")
+        else:
+            write(f"{indent}- {semantic_id}")
+
+        # Queue children
+        for child in reversed(n.children):
+            if isinstance(child, (Node, Text)):
+                stack.append((child, depth + 1))
+
+    return buf.getvalue()
@@ -4,7 +4,7 @@ from typing import Any, Dict, Iterator, List, Optional
 
 from domnode import Node, parse_cdp, parse_html
 
-from ._internal.chunker import Chunk, chunk_tree
+from ._internal.chunker import Chunk, chunk_tree, iter_chunks
 from ._internal.semantic import apply_filters_with_original, generate_semantic_ids
 from .dom_node import DomNode
 from .tokenizer import TiktokenTokenizer, Tokenizer
@@ -225,6 +225,35 @@ class DomContext:
             )
         return self._chunks_cache[cache_key]
 
+    def iter_chunks(
+        self, max_tokens: int = 500, overlap: int = 50, include_parent_path: bool = True
+    ) -> Iterator[Chunk]:
+        """Yield chunks one at a time, without building the whole list.
+
+        Uses the chunks() cache when it already holds these settings; otherwise
+        chunks are built lazily and not cached.
+
+        Args:
+            max_tokens: Maximum chunk size in tokens (default: 500)
+            overlap: Overlap between chunks in tokens (default: 50)
+            include_parent_path: Include parent path and continuation indicators (default: True)
+
+        Yields:
+            Chunk objects in document order
+        """
+        cached = self._chunks_cache.get((max_tokens, overlap, include_parent_path))
+        if cached is not None:
+            yield from cached
+            return
+
+        yield from iter_chunks(
+            self._root,
+            self._tokenizer,
+            size=max_tokens,
+            overlap=overlap,
+            include_parent_path=include_parent_path,
+        )
+
     def get_element(self, element_id: str) -> DomNode:
         """Get element by its readable ID.
 
@@ -241,7 +270,7 @@ class DomContext:
         if node is None:
             raise KeyError(f"Element '{element_id}' not found")
 
-        return DomNode(node)
+        return DomNode._wrap(node)
 
     def elements(self, tag: Optional[str] = None) -> List[DomNode]:
         """Get all elements, optionally filtered by tag.
@@ -252,11 +281,11 @@ class DomContext:
         Returns:
             List of DomNode objects
         """
-        result = []
-        for element_id, node in self._id_mapping.items():
-            if tag is None or node.tag == tag:
-                result.append(DomNode(node))
-        return result
+        # Stream the flat node index; only matching nodes get wrapped
+        nodes = self._id_mapping.values()
+        if tag is None:
+            return [DomNode._wrap(node) for node in nodes]
+        return [DomNode._wrap(node) for node in nodes if node.tag == tag]
 
     def __iter__(self) -> Iterator[DomNode]:
         """Iterate over all elements in document order.
@@ -264,14 +293,9 @@ class DomContext:
         Yields:
             DomNode objects in DFS order
         """
-
-        def dfs(node: Node):
-            yield DomNode(node)
-            for child in node.children:
-                if isinstance(child, Node):
-                    yield from dfs(child)
-
-        yield from dfs(self._root)
+        # id_mapping is filled in DFS pre-order, so it doubles as a flat node index
+        for node in self._id_mapping.values():
+            yield DomNode._wrap(node)
 
     def __repr__(self) -> str:
         return f"DomContext(elements={len(self._id_mapping)}, tokens={self.tokens})"
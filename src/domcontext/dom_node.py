@@ -1,16 +1,32 @@
 """DomNode - Public API for DOM elements."""
 
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Optional, Tuple
 
 from domnode import Node, Text
 
 
+def _subtree_text(node: Node) -> str:
+    """Concatenate all descendant text in document order (like Node.get_text())."""
+    parts = []
+    stack = list(reversed(node.children))
+    while stack:
+        child = stack.pop()
+        if isinstance(child, Text):
+            parts.append(child.content)
+        elif isinstance(child, Node):
+            stack.extend(reversed(child.children))
+    return "".join(parts)
+
+
 class DomNode:
     """Public API wrapper around domnode.Node.
 
     Provides clean interface for accessing element data and navigating DOM tree.
     """
 
+    __slots__ = ("_node", "_children")
+
     def __init__(self, node: Node):
         """Initialize DomNode from domnode.Node.
 
@@ -21,6 +37,18 @@ class DomNode:
             raise ValueError("DomNode requires a domnode.Node instance")
 
         self._node = node
+        self._children: Optional[Tuple["DomNode", ...]] = None
+
+    @classmethod
+    def _wrap(cls, node: Node) -> "DomNode":
+        """Wrap a node already known to be a domnode.Node (skips validation).
+
+        Used internally when walking trees built by DomContext.
+        """
+        wrapper = cls.__new__(cls)
+        wrapper._node = node
+        wrapper._children = None
+        return wrapper
 
     @property
     def tag(self) -> str:
@@ -30,7 +58,7 @@ class DomNode:
     @property
     def text(self) -> str:
         """All text content from this element and descendants (like innerText)."""
-        return self._node.get_text()
+        return _subtree_text(self._node)
 
     @property
     def attributes(self) -> Dict[str, str]:
@@ -46,12 +74,9 @@ class DomNode:
     def backend_node_id(self) -> Optional[int]:
         """Backend node ID from CDP (for evaluation/testing).
 
-        Returns the backend_node_id from the original node if available.
+        Returns the backend_node_id from the original node if available
+        (resolved once during semantic ID generation).
         """
-        # Check if this node has original_node reference
-        original = self._node.metadata.get("original_node")
-        if original is not None:
-            return original.metadata.get("backend_node_id")
         return self._node.metadata.get("backend_node_id")
 
     @property
@@ -59,20 +84,20 @@ class DomNode:
         """Parent element in DOM tree."""
         if self._node.parent is None:
             return None
-        return DomNode(self._node.parent)
+        return DomNode._wrap(self._node.parent)
 
     @property
-    def children(self) -> List["DomNode"]:
-        """Child elements (not text nodes) in DOM tree.
+    def children(self) -> Tuple["DomNode", ...]:
+        """Child elements (not text nodes) in DOM tree (cached).
 
         Returns only element children, not text nodes.
         Text content is accessed via .text property.
         """
-        result = []
-        for child in self._node.children:
-            if isinstance(child, Node):
-                result.append(DomNode(child))
-        return result
+        if self._children is None:
+            self._children = tuple(
+                DomNode._wrap(child) for child in self._node.children if isinstance(child, Node)
+            )
+        return self._children
 
     def __repr__(self) -> str:
         if self.semantic_id:
@@ -80,7 +105,7 @@ class DomNode:
         return f'DomNode(tag="{self.tag}")'
 
     def __str__(self) -> str:
-        attrs = ", ".join(f'{k}="{v}"' for k, v in list(self.attributes.items())[:3])
+        attrs = ", ".join(f'{k}="{v}"' for k, v in islice(self.attributes.items(), 3))
         if len(self.attributes) > 3:
             attrs += ", ..."
         return f"<{self.tag} {attrs}>" if attrs else f"<{self.tag}>"
@@ -1,6 +1,11 @@
 """Tokenizer interface for counting tokens."""
 
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List, Sequence
+
+import tiktoken
 
 
 class Tokenizer(ABC):
@@ -18,6 +23,33 @@ class Tokenizer(ABC):
         """
         pass
 
+    def count_tokens_batch(self, texts: Sequence[str]) -> List[int]:
+        """Count tokens for many texts at once.
+
+        Override when the backend can encode a batch faster than one call
+        per text.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Number of tokens for each text, in order
+        """
+        return [self.count_tokens(text) for text in texts]
+
+
+# Batches smaller than this are encoded sequentially (a thread pool costs more)
+_PARALLEL_BATCH_MIN = 512
+
+# Texts per worker thread when a batch is encoded in parallel
+_TEXTS_PER_THREAD = 256
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(encoding: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding once and share it across tokenizer instances."""
+    return tiktoken.get_encoding(encoding)
+
 
 class TiktokenTokenizer(Tokenizer):
     """Default tokenizer using tiktoken (OpenAI's tokenizer).
@@ -31,9 +63,7 @@ class TiktokenTokenizer(Tokenizer):
         Args:
             encoding: Tiktoken encoding name (default: cl100k_base for GPT-4/3.5)
         """
-        import tiktoken
-
-        self._enc = tiktoken.get_encoding(encoding)
+        self._enc = _get_encoding(encoding)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken.
@@ -44,4 +74,24 @@ class TiktokenTokenizer(Tokenizer):
         Returns:
             Number of tokens
         """
-        return len(self._enc.encode(text))
+        # encode_ordinary: page text is never a special token (and encode()
+        # would raise on strings like "<|endoftext|>")
+        return len(self._enc.encode_ordinary(text))
+
+    def count_tokens_batch(self, texts: Sequence[str]) -> List[int]:
+        """Count tokens for many texts, encoding large batches on tiktoken's thread pool.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Number of tokens for each text, in order
+        """
+        if len(texts) < _PARALLEL_BATCH_MIN:
+            encode = self._enc.encode_ordinary
+            return [len(encode(text)) for text in texts]
+
+        # tiktoken releases the GIL while encoding, so threads scale
+        num_threads = min(os.cpu_count() or 1, len(texts) // _TEXTS_PER_THREAD)
+        batch = self._enc.encode_ordinary_batch(list(texts), num_threads=num_threads)
+        return [len(tokens) for tokens in batch]
@@ -4,10 +4,12 @@ This module requires the optional 'playwright' dependency.
 Install with: pip install domcontext[playwright]
 """
 
-from typing import TYPE_CHECKING, Any, Dict
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
-    from playwright.async_api import Page
+    from playwright.async_api import CDPSession, Page
 
 # Check if playwright is installed
 try:
@@ -17,19 +19,37 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# CDP sessions reused per page (dropped automatically when the page is collected)
+_CDP_SESSIONS: "WeakKeyDictionary[Page, CDPSession]" = WeakKeyDictionary()
 
-async def capture_snapshot(page: "Page") -> Dict[str, Any]:
+# Computed styles needed for visibility filtering
+DEFAULT_COMPUTED_STYLES = ("display", "visibility", "opacity")
+
+
+async def capture_snapshot(
+    page: "Page",
+    *,
+    computed_styles: Sequence[str] = DEFAULT_COMPUTED_STYLES,
+    include_paint_order: bool = False,
+    include_dom_rects: bool = False,
+) -> Dict[str, Any]:
     """
     Capture CDP DOMSnapshot from a Playwright page.
 
-    This function captures a complete DOM snapshot including:
+    This function captures a DOM snapshot including:
     - DOM structure with all nodes
-    - Computed styles (display, visibility, opacity)
+    - Computed styles (display, visibility, opacity by default)
     - Layout information (bounding boxes)
-    - Paint order for rendering
+
+    Paint order and extra DOM rects (offset/client/scroll) are not used by
+    DomContext and are only requested when asked for, keeping the payload small.
 
     Args:
         page: Playwright Page object from an active browser session
+        computed_styles: Computed style properties to capture
+            (default: display, visibility, opacity)
+        include_paint_order: Include rendering order (default: False)
+        include_dom_rects: Include offset/client/scroll rects (default: False)
 
     Returns:
         Dict containing CDP DOMSnapshot with:
@@ -65,22 +85,20 @@ async def capture_snapshot(page: "Page") -> Dict[str, Any]:
             "Playwright is not installed. " "Install it with: pip install domcontext[playwright]"
         )
 
-    # Get CDP session from the page
-    cdp = await page.context.new_cdp_session(page)
-
-    # Capture snapshot with full layout and style information
-    snapshot = await cdp.send(
-        "DOMSnapshot.captureSnapshot",
-        {
-            "computedStyles": [
-                "display",
-                "visibility",
-                "opacity",
-            ],  # Styles for visibility filtering
-            "includePaintOrder": True,  # Include rendering order
-            "includeDOMRects": True,  # Include bounding boxes
-        },
-    )
+    # Reuse the page's CDP session if one was already opened
+    cdp = _CDP_SESSIONS.get(page)
+    if cdp is None:
+        cdp = await page.context.new_cdp_session(page)
+        _CDP_SESSIONS[page] = cdp
+
+    # Layout bounds are always returned; paint order and DOM rects are opt-in
+    params: Dict[str, Any] = {"computedStyles": list(computed_styles)}
+    if include_paint_order:
+        params["includePaintOrder"] = True
+    if include_dom_rects:
+        params["includeDOMRects"] = True
+
+    snapshot = await cdp.send("DOMSnapshot.captureSnapshot", params)
 
     return snapshot
 
@@ -114,8 +132,7 @@ async def capture_snapshot_with_html(page: "Page") -> tuple[Dict[str, Any], str]
             "Playwright is not installed. " "Install it with: pip install domcontext[playwright]"
         )
 
-    # Capture both simultaneously
-    snapshot = await capture_snapshot(page)
-    html = await page.content()
+    # Capture both concurrently (independent round-trips)
+    snapshot, html = await asyncio.gather(capture_snapshot(page), page.content())
 
     return snapshot, html
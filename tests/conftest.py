@@ -88,3 +88,21 @@ def wrapper_html():
     </body>
     </html>
     """
+
+
+@pytest.fixture
+def nav_html():
+    """HTML with a nested navigation list."""
+    return """
+    <html>
+    <body>
+        <nav role="navigation">
+            <ul>
+                <li><a href="/">Home</a> first</li>
+                <li><a href="/about">About</a> second</li>
+            </ul>
+        </nav>
+        <p>Footer</p>
+    </body>
+    </html>
+    """
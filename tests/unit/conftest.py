@@ -0,0 +1,86 @@
+"""Shared fixtures for unit tests."""
+
+from typing import Callable, Dict, List
+
+import pytest
+from domnode import Node, Text
+
+from domcontext._internal.semantic import generate_semantic_ids
+from domcontext.tokenizer import Tokenizer
+
+
+class MockTokenizer(Tokenizer):
+    """Character-count tokenizer.
+
+    count_tokens is len itself, so calls from the chunker go straight to C.
+    """
+
+    count_tokens = staticmethod(len)
+
+
+class CountingTokenizer(Tokenizer):
+    """Character-count tokenizer that records every string it is asked to count."""
+
+    def __init__(self):
+        self.calls: List[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        """Record the call and count characters."""
+        self.calls.append(text)
+        return len(text)
+
+
+@pytest.fixture(scope="session")
+def mock_tokenizer() -> MockTokenizer:
+    """Stateless tokenizer shared by the whole test session."""
+    return MockTokenizer()
+
+
+@pytest.fixture
+def counting_tokenizer() -> CountingTokenizer:
+    """Fresh recording tokenizer for each test."""
+    return CountingTokenizer()
+
+
+@pytest.fixture(scope="session")
+def body_with_divs() -> Callable[[int], Node]:
+    """Build body > n x div > text with semantic IDs, once per size.
+
+    chunk_tree only reads the tree, so built trees are shared between tests.
+    """
+    cache: Dict[int, Node] = {}
+
+    def build(n: int) -> Node:
+        body = cache.get(n)
+        if body is None:
+            body = Node(tag="body")
+            divs = [Node(tag="div") for _ in range(n)]
+            for i, div in enumerate(divs):
+                # append() (not children=[...]) so parent links are set
+                div.append(Text(f"Item {i} content"))
+                body.append(div)
+            generate_semantic_ids(body)
+            cache[n] = body
+        return body
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def body_with_attributes() -> Node:
+    """Build body > a with many long attributes."""
+    body = Node(tag="body")
+    body.append(Node(tag="a", attrib={f"data-{i}": "value" * 3 for i in range(8)}))
+    generate_semantic_ids(body)
+    return body
+
+
+@pytest.fixture(scope="session")
+def body_with_long_text() -> Node:
+    """Build body > p > 40-word text."""
+    body = Node(tag="body")
+    p = Node(tag="p")
+    p.append(Text("word " * 40))
+    body.append(p)
+    generate_semantic_ids(body)
+    return body
@@ -0,0 +1,297 @@
+"""Unit tests for the chunker."""
+
+import re
+from itertools import accumulate
+
+import pytest
+from domnode import Node, Text
+
+from domcontext._internal.chunker import Chunk, chunk_tree, iter_chunks
+from domcontext._internal.chunker.chunker import _calculate_overlap_start
+from domcontext._internal.semantic import generate_semantic_ids
+from domcontext._internal.serializer import serialize_to_markdown
+
+# chunk_tree never mutates its input, so shared trees are safe across workers
+pytestmark = pytest.mark.parallel_safe
+
+# Text continued into ('"...') or out of ('..."') a chunk
+_CONTINUATION_RE = re.compile(r'\.\.\."|"\.\.\.')
+
+
+class TestMockTokenizer:
+    """Test the shared mock tokenizer."""
+
+    def test_counts_characters(self, mock_tokenizer):
+        """Test that token counts are character counts."""
+        assert mock_tokenizer.count_tokens("- div-1\n") == 8
+        assert mock_tokenizer.count_tokens("") == 0
+
+
+class TestChunk:
+    """Test the Chunk container."""
+
+    def test_markdown_follows_added_text(self):
+        """Test that markdown and tokens reflect every add_text call."""
+        chunk = Chunk()
+        chunk.add_text("- body-1\n", 3)
+
+        assert chunk.markdown == "- body-1\n"
+        chunk.add_text("  - div-1\n", 4)
+        assert chunk.markdown == "- body-1\n  - div-1\n"
+        assert chunk.tokens == 7
+
+    def test_keeps_per_piece_tokens(self, mock_tokenizer, body_with_long_text):
+        """Test that each piece's token count is kept alongside the text."""
+        chunks = chunk_tree(body_with_long_text, mock_tokenizer, size=60, overlap=0)
+
+        for chunk in chunks:
+            piece_tokens = chunk.get_piece_tokens()
+            assert piece_tokens == tuple(map(len, chunk.text_pieces))
+            assert sum(piece_tokens) == chunk.tokens
+
+    @pytest.mark.parametrize(
+        "piece_tokens, expected",
+        [(None, (0, 0)), ([3, 4], (3, 4))],
+        ids=["default", "given"],
+    )
+    def test_constructor_pieces(self, piece_tokens, expected):
+        """Test that constructor pieces get token counts (0 each unless given)."""
+        chunk = Chunk(["- body-1\n", "  - div-1\n"], piece_tokens)
+        chunk.add_text("    - p-1\n", 5)
+
+        assert chunk.get_piece_tokens() == expected + (5,)
+        assert chunk.tokens == sum(expected) + 5
+        assert chunk.markdown == "- body-1\n  - div-1\n    - p-1\n"
+
+    def test_constructor_rejects_mismatched_piece_tokens(self):
+        """Test that piece_tokens must match text_pieces in length."""
+        with pytest.raises(ValueError):
+            Chunk(["- body-1\n"], [1, 2])
+
+    def test_text_pieces_are_read_only(self):
+        """Test that pieces cannot change behind add_text's back."""
+        pieces = ["- body-1\n"]
+        chunk = Chunk(pieces, [3])
+        pieces.append("  - div-1\n")
+
+        assert chunk.text_pieces == ("- body-1\n",)
+        with pytest.raises(AttributeError):
+            chunk.text_pieces = ["x\n"]
+
+    def test_equality_ignores_piece_split(self):
+        """Test that equality compares pieces and total tokens, not per-piece counts."""
+        assert Chunk(["a\n", "b\n"], [1, 2]) == Chunk(["a\n", "b\n"], [2, 1])
+        assert Chunk(["a\n"], [1]) != Chunk(["a\n"], [2])
+
+
+class TestChunkTree:
+    """Test chunk_tree."""
+
+    def test_single_chunk_when_fits(self, mock_tokenizer, body_with_divs):
+        """Test that a small tree produces one chunk with all content."""
+        root = body_with_divs(3)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=1000, overlap=0)
+
+        assert len(chunks) == 1
+        assert "div-3" in chunks[0].markdown
+        assert '"Item 2 content"' in chunks[0].markdown
+
+    def test_single_chunk_counts_each_line_once(self, counting_tokenizer, body_with_divs):
+        """Test that a fitting tree is emitted in one pass with one count per line."""
+        root = body_with_divs(3)
+
+        chunks = chunk_tree(root, counting_tokenizer, size=1000, overlap=0)
+
+        assert chunks[0].markdown == serialize_to_markdown(root) + "\n"
+        assert counting_tokenizer.calls == list(chunks[0].text_pieces)
+
+    def test_single_chunk_when_exactly_size(self, mock_tokenizer):
+        """Test that content exactly filling the size is not split.
+
+        Short trailing words are smaller than a continuation marker, so a
+        worst-case fit check would split this text needlessly.
+        """
+        body = Node(tag="body")
+        p = Node(tag="p")
+        p.append(Text("alpha beta gamma a b"))
+        body.append(p)
+        generate_semantic_ids(body)
+        expected = '- body-1\n  - p-1\n    - "alpha beta gamma a b"\n'
+
+        chunks = chunk_tree(body, mock_tokenizer, size=len(expected), overlap=0)
+
+        assert [chunk.markdown for chunk in chunks] == [expected]
+
+    def test_multiple_chunks_created(self, mock_tokenizer, body_with_divs):
+        """Test that content larger than the chunk size is split."""
+        root = body_with_divs(10)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=60, overlap=0)
+
+        assert len(chunks) > 1
+
+    @pytest.mark.parametrize(
+        "n_divs, size, overlap",
+        [(5, 40, 5), (10, 60, 0), (10, 80, 15), (20, 120, 20), (20, 200, 50)],
+    )
+    def test_chunk_respects_size_limit(self, mock_tokenizer, body_with_divs, n_divs, size, overlap):
+        """Test that no chunk exceeds the size limit and token counts match the text."""
+        root = body_with_divs(n_divs)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=size, overlap=overlap)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.tokens <= size
+            assert chunk.tokens == mock_tokenizer.count_tokens(chunk.markdown)
+
+    def test_all_content_is_covered(self, mock_tokenizer, body_with_divs):
+        """Test that every element appears in some chunk."""
+        root = body_with_divs(10)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=60, overlap=0)
+
+        for i in range(10):
+            assert any(f'"Item {i} content"' in chunk.markdown for chunk in chunks)
+
+    def test_overlap_working(self, mock_tokenizer, body_with_divs):
+        """Test that consecutive chunks share content when overlap is set."""
+        root = body_with_divs(10)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=80, overlap=15, include_parent_path=False)
+
+        assert len(chunks) > 1
+        chunk1_lines = set(chunks[0].markdown.splitlines())
+        chunk2_lines = set(chunks[1].markdown.splitlines())
+        assert not chunk1_lines.isdisjoint(chunk2_lines)
+
+    def test_counts_each_string_once(self, counting_tokenizer, body_with_divs):
+        """Test that repeated lines are counted once per chunking run."""
+        chunks = chunk_tree(body_with_divs(10), counting_tokenizer, size=60, overlap=15)
+        calls = counting_tokenizer.calls
+
+        assert len(chunks) > 1
+        assert len(calls) == len(set(calls))
+
+    def test_iter_chunks_is_lazy(self, counting_tokenizer, body_with_divs):
+        """Test that iter_chunks yields the first chunk before chunking the rest."""
+        root = body_with_divs(20)
+        chunks = iter_chunks(root, counting_tokenizer, size=60, overlap=0)
+
+        first = next(chunks)
+        calls_for_first = len(counting_tokenizer.calls)
+        rest = list(chunks)
+
+        assert first.markdown.startswith("- body-1")
+        assert len(rest) > 1
+        assert calls_for_first < len(counting_tokenizer.calls)
+
+    def test_element_with_attributes_splits(self, mock_tokenizer, body_with_attributes):
+        """Test that an element's attributes are split across chunks."""
+        chunks = chunk_tree(body_with_attributes, mock_tokenizer, size=60, overlap=0)
+
+        assert len(chunks) > 1
+        assert any("..." in chunk.markdown for chunk in chunks)
+
+    def test_long_text_splits(self, mock_tokenizer, body_with_long_text):
+        """Test that long text is split with continuation markers."""
+        chunks = chunk_tree(body_with_long_text, mock_tokenizer, size=60, overlap=0)
+
+        assert len(chunks) > 1
+        assert any(_CONTINUATION_RE.search(chunk.markdown) for chunk in chunks)
+
+    def test_continuation_markers_correct(self, mock_tokenizer, body_with_long_text):
+        """Test that split text is marked on the right side of each chunk."""
+        chunks = chunk_tree(body_with_long_text, mock_tokenizer, size=60, overlap=0)
+        mds = [chunk.markdown for chunk in chunks]
+
+        # First chunk: opens the text and continues it
+        assert '"word' in mds[0]
+        assert mds[0].endswith('..."\n')
+
+        # Middle chunks: continue on both sides
+        for md in mds[1:-1]:
+            assert '"...' in md
+            assert md.endswith('..."\n')
+
+        # Last chunk: continues from the previous chunk and closes the text
+        assert '"...' in mds[-1]
+        assert mds[-1].endswith('word"\n')
+
+    def test_parent_path_included_in_subsequent_chunks(self, mock_tokenizer, body_with_divs):
+        """Test that later chunks start with their parent path."""
+        root = body_with_divs(10)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=60, overlap=0)
+        mds = [chunk.markdown for chunk in chunks]
+
+        assert len(mds) > 1
+        for md in mds[1:]:
+            assert md.startswith("- body-1\n")
+
+    def test_parent_path_excluded_when_disabled(self, mock_tokenizer, body_with_divs):
+        """Test that include_parent_path=False omits the parent path."""
+        root = body_with_divs(10)
+
+        chunks = chunk_tree(root, mock_tokenizer, size=60, overlap=0, include_parent_path=False)
+        mds = [chunk.markdown for chunk in chunks]
+
+        assert len(mds) > 1
+        assert not any(md.startswith("- body-1") for md in mds[1:])
+
+
+class TestCalculateOverlapStart:
+    """Test overlap start search over token prefix sums."""
+
+    # Atom content tokens [3, 0, 2, 4] -> prefix sums
+    PREFIX = [0, 3, 3, 5, 9]
+
+    @pytest.mark.parametrize(
+        "chunk_start, chunk_end, overlap, expected",
+        [
+            (0, 4, 4, 3),  # only the last atom fits
+            (0, 4, 6, 1),  # last two atoms fit exactly, plus the zero-token one
+            (0, 4, 9, 0),  # whole chunk fits, clamped to chunk start
+            (1, 4, 100, 1),  # never goes before chunk start
+            (0, 4, 3, 4),  # last atom alone is too big
+            (0, 2, 0, 1),  # zero-token atoms always fit
+            (2, 2, 5, 2),  # empty chunk
+        ],
+    )
+    def test_overlap_start(self, chunk_start, chunk_end, overlap, expected):
+        """Test that the earliest start within the overlap budget is returned."""
+        assert _calculate_overlap_start(self.PREFIX, chunk_start, chunk_end, overlap) == expected
+
+    @pytest.mark.parametrize(
+        "atom_tokens, chunk_start, overlap, expected",
+        [
+            # Last atom alone is over budget - next chunk starts right after this one
+            ([1, 0, 0, 7], 0, 6, 4),
+            # Budget exactly matches the last three atoms (2 + 4 + 3)
+            ([5, 2, 4, 3], 0, 9, 1),
+            # Exact hit inside a later chunk
+            ([5, 2, 4, 3, 1], 2, 4, 3),
+            # Budget larger than the whole chunk - overlap is the chunk itself
+            ([5, 2, 4, 3], 1, 1000, 1),
+        ],
+        ids=[
+            "last-atom-too-big",
+            "exact-boundary",
+            "exact-boundary-later-chunk",
+            "overlap-gt-chunk",
+        ],
+    )
+    def test_overlap_start_from_atom_tokens(self, atom_tokens, chunk_start, overlap, expected):
+        """Test overlap starts computed from per-atom token counts."""
+        prefix = list(accumulate(atom_tokens, initial=0))
+
+        start = _calculate_overlap_start(prefix, chunk_start, len(atom_tokens), overlap)
+
+        assert start == expected
+        # The chosen suffix fits the budget (unless it is empty)
+        assert prefix[-1] - prefix[start] <= overlap or start == len(atom_tokens)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
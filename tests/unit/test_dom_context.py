@@ -0,0 +1,216 @@
+"""Unit tests for DomContext."""
+
+from operator import attrgetter
+from typing import Callable, Dict, Optional
+
+import pytest
+from domnode import Node, Text
+
+from domcontext import DomContext, DomNode
+
+# Contexts are cached per module and never mutated, so every test is read-only
+pytestmark = pytest.mark.parallel_safe
+
+
+get_tag = attrgetter("tag")
+get_parent_id = attrgetter("parent.semantic_id")
+
+
+@pytest.fixture(scope="module")
+def parsed(mock_tokenizer) -> Callable[[str], DomContext]:
+    """Parse HTML into a DomContext once per input for the whole module.
+
+    Tests only read from the context, so cached instances are shared.
+    """
+    cache: Dict[str, DomContext] = {}
+
+    def parse(html: str) -> DomContext:
+        context = cache.get(html)
+        if context is None:
+            context = cache[html] = DomContext.from_html(html, tokenizer=mock_tokenizer)
+        return context
+
+    return parse
+
+
+def _first_child(node: DomNode) -> Optional[DomNode]:
+    """Return the first element child, or None for leaf elements."""
+    return next(iter(node.children), None)
+
+
+class TestFromHtml:
+    """Test DomContext.from_html."""
+
+    @pytest.mark.parametrize(
+        "html_fixture, present, absent",
+        [
+            ("simple_html", ["- body-1", '"Hello World"'], ["title"]),
+            (
+                "hidden_elements_html",
+                ['"Visible paragraph"'],
+                ["Hidden div", "Invisible div", "alert"],
+            ),
+            ("wrapper_html", ['- a-1 (href="/home")', "- button-1"], ["div-"]),
+            ("nested_html", ["- p-1", '"Deeply nested"'], ["div-"]),
+        ],
+        ids=["simple", "hidden", "wrappers", "nested"],
+    )
+    def test_parse(self, parsed, request, html_fixture, present, absent):
+        """Test that visible content is serialized and filtered content is not."""
+        context = parsed(request.getfixturevalue(html_fixture))
+
+        for text in present:
+            assert text in context.markdown
+        for text in absent:
+            assert text not in context.markdown
+
+    def test_tokens_use_given_tokenizer(self, parsed, simple_html):
+        """Test that tokens are counted with the provided tokenizer."""
+        context = parsed(simple_html)
+
+        assert context.tokens == len(context.markdown)
+
+    def test_reuses_cached_parse(self, parsed, simple_html):
+        """Test that the module fixture returns the same context per input."""
+        assert parsed(simple_html) is parsed(simple_html)
+
+
+class TestChunks:
+    """Test DomContext chunking."""
+
+    def test_iter_chunks_matches_chunks(self, mock_tokenizer, nav_html):
+        """Test that streamed chunks equal the cached list, before and after it exists."""
+        context = DomContext.from_html(nav_html, tokenizer=mock_tokenizer)
+
+        streamed = context.iter_chunks(max_tokens=40, overlap=5)
+        assert iter(streamed) is streamed
+        streamed = list(streamed)
+
+        chunks = context.chunks(max_tokens=40, overlap=5)
+
+        assert len(chunks) > 1
+        assert streamed == chunks
+        assert list(context.iter_chunks(max_tokens=40, overlap=5)) == chunks
+
+
+class TestElementAccess:
+    """Test element lookup and iteration."""
+
+    def test_get_element(self, parsed, wrapper_html):
+        """Test lookup by semantic ID."""
+        context = parsed(wrapper_html)
+
+        element = context.get_element("a-1")
+
+        assert isinstance(element, DomNode)
+        assert element.tag == "a"
+        assert element.text == "Home"
+
+    def test_get_element_missing(self, parsed, wrapper_html):
+        """Test that unknown IDs raise KeyError."""
+        context = parsed(wrapper_html)
+
+        with pytest.raises(KeyError):
+            context.get_element("a-99")
+
+    def test_elements_by_tag(self, parsed, wrapper_html):
+        """Test filtering elements by tag."""
+        context = parsed(wrapper_html)
+
+        buttons = context.elements("button")
+
+        assert [b.semantic_id for b in buttons] == ["button-1"]
+
+    def test_elements_index_all_tags(self, parsed, nav_html):
+        """Test that every surviving element is reachable through elements()."""
+        context = parsed(nav_html)
+
+        tags = set(map(get_tag, context.elements()))
+
+        assert {"body", "nav", "ul", "li", "a", "p"} <= tags
+
+    def test_iter_document_order(self, parsed, wrapper_html):
+        """Test that iteration yields elements in document order."""
+        context = parsed(wrapper_html)
+
+        assert [e.semantic_id for e in context] == ["body-1", "a-1", "button-1"]
+
+
+class TestDomNodeText:
+    """Test DomNode.text."""
+
+    def test_text_concatenates_descendants(self):
+        """Test that text joins all descendant text in document order."""
+        div = Node(tag="div")
+        p = Node(tag="p")
+        p.append(Text("Hello"))
+        div.append(p)
+        div.append(Text(" World"))
+
+        assert DomNode(div).text == "Hello World"
+
+    def test_text_and_children_include_subclasses(self):
+        """Test that Node and Text subclasses are walked like their base types."""
+
+        class CustomNode(Node):
+            pass
+
+        class CustomText(Text):
+            pass
+
+        div = Node(tag="div")
+        span = CustomNode(tag="span")
+        span.append(CustomText("Hello"))
+        div.append(span)
+
+        node = DomNode(div)
+
+        assert node.text == "Hello"
+        assert [child.tag for child in node.children] == ["span"]
+
+    def test_text_reflects_tree_changes(self):
+        """Test that text follows changes made to the tree after wrapping."""
+        p = Node(tag="p")
+        p.append(Text("Hello"))
+        node = DomNode(p)
+
+        assert node.text == "Hello"
+        p.append(Text(" World"))
+
+        assert node.text == "Hello World"
+
+
+class TestNavigation:
+    """Test walking the element tree through DomNode."""
+
+    def test_parent_child_relationships(self, parsed, nav_html):
+        """Test that children point back at their parent."""
+        context = parsed(nav_html)
+        ul = context.get_element("ul-1")
+
+        assert list(map(get_tag, ul.children)) == ["li", "li"]
+        assert set(map(get_parent_id, ul.children)) == {"ul-1"}
+
+    def test_walk_down_and_up_tree(self, parsed, nav_html):
+        """Test descending by first child and walking back up to the root."""
+        context = parsed(nav_html)
+
+        node = context.get_element("body-1")
+        path = []
+        while node is not None:
+            path.append(node.semantic_id)
+            node = _first_child(node)
+
+        assert path == ["body-1", "nav-1", "ul-1", "li-1", "a-1"]
+
+        node = context.get_element("a-1")
+        ancestors = []
+        while node is not None:
+            ancestors.append(node.semantic_id)
+            node = node.parent
+
+        assert ancestors == list(reversed(path))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""Unit tests for the Playwright snapshot helpers (with mocked pages)."""
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+import pytest
+
+from domcontext.utils import playwright as pw
+
+
+@pytest.fixture(autouse=True)
+def playwright_available(mocker):
+    """Pretend playwright is installed and start each test with no cached sessions."""
+    mocker.patch.object(pw, "PLAYWRIGHT_AVAILABLE", True)
+    mocker.patch.object(pw, "_CDP_SESSIONS", WeakKeyDictionary())
+
+
+@pytest.fixture
+def make_page(mocker):
+    """Build mock pages whose CDP sessions answer captureSnapshot with a fixed dict."""
+
+    def make():
+        page = mocker.MagicMock()
+        session = mocker.MagicMock()
+        session.send = mocker.AsyncMock(return_value={"documents": [], "strings": []})
+        page.context.new_cdp_session = mocker.AsyncMock(return_value=session)
+        return page
+
+    return make
+
+
+class TestCdpSessionReuse:
+    """Test that CDP sessions are opened once per page."""
+
+    def test_session_reused_for_same_page(self, make_page):
+        """Test that repeated captures on one page open a single session."""
+        page = make_page()
+
+        asyncio.run(pw.capture_snapshot(page))
+        asyncio.run(pw.capture_snapshot(page))
+
+        page.context.new_cdp_session.assert_awaited_once_with(page)
+        assert page.context.new_cdp_session.return_value.send.await_count == 2
+
+    def test_each_page_gets_own_session(self, make_page):
+        """Test that a second page does not reuse the first page's session."""
+        page1 = make_page()
+        page2 = make_page()
+
+        asyncio.run(pw.capture_snapshot(page1))
+        asyncio.run(pw.capture_snapshot(page2))
+
+        page1.context.new_cdp_session.assert_awaited_once_with(page1)
+        page2.context.new_cdp_session.assert_awaited_once_with(page2)
+        assert pw._CDP_SESSIONS[page1] is not pw._CDP_SESSIONS[page2]
+
+
+class TestCaptureSnapshotParams:
+    """Test the DOMSnapshot.captureSnapshot request."""
+
+    def _sent_params(self, page):
+        """Return the params dict of the single captureSnapshot call."""
+        send = page.context.new_cdp_session.return_value.send
+        send.assert_awaited_once()
+        method, params = send.await_args.args
+        assert method == "DOMSnapshot.captureSnapshot"
+        return params
+
+    def test_default_request_omits_optional_data(self, make_page):
+        """Test that paint order and DOM rects are not requested by default."""
+        page = make_page()
+
+        asyncio.run(pw.capture_snapshot(page))
+
+        assert self._sent_params(page) == {"computedStyles": ["display", "visibility", "opacity"]}
+
+    def test_flags_request_optional_data(self, make_page):
+        """Test that the flags add paint order, DOM rects and custom styles."""
+        page = make_page()
+
+        asyncio.run(
+            pw.capture_snapshot(
+                page,
+                computed_styles=("display",),
+                include_paint_order=True,
+                include_dom_rects=True,
+            )
+        )
+
+        assert self._sent_params(page) == {
+            "computedStyles": ["display"],
+            "includePaintOrder": True,
+            "includeDOMRects": True,
+        }
+
+
+class TestCaptureSnapshotWithHtml:
+    """Test capture_snapshot_with_html."""
+
+    def test_returns_snapshot_then_html(self, make_page, mocker):
+        """Test that the concurrent capture still returns (snapshot, html)."""
+        page = make_page()
+        page.content = mocker.AsyncMock(return_value="<html></html>")
+
+        snapshot, html = asyncio.run(pw.capture_snapshot_with_html(page))
+
+        assert snapshot == {"documents": [], "strings": []}
+        assert html == "<html></html>"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,179 @@
+"""Unit tests for semantic processing."""
+
+import pytest
+from domnode import BoundingBox, Node, Text, parse_html
+
+from domcontext._internal.semantic import (
+    apply_filters_with_original,
+    clean_attributes_in_place,
+    deep_copy_with_metadata,
+    filter_visibility,
+)
+
+
+def _tags(node):
+    """Collect element tags in document order."""
+    tags = [node.tag]
+    for child in node.children:
+        if isinstance(child, Node):
+            tags.extend(_tags(child))
+    return tags
+
+
+class TestDeepCopyWithMetadata:
+    """Test deep copying with original node references."""
+
+    def test_copies_text_children(self):
+        """Test that text children are copied as new Text nodes."""
+        p = Node(tag="p")
+        p.append(Text("Hello World"))
+
+        copied = deep_copy_with_metadata(p)
+
+        first_text = next((c for c in copied.children if type(c) is Text), None)
+        assert first_text is not None
+        assert first_text.content == "Hello World"
+        assert first_text is not p.children[0]
+        assert copied.metadata["original_node"] is p
+
+    def test_copies_subclass_children(self):
+        """Test that Node and Text subclasses are copied, not dropped."""
+
+        class CustomNode(Node):
+            pass
+
+        class CustomText(Text):
+            pass
+
+        div = Node(tag="div")
+        span = CustomNode(tag="span")
+        span.append(CustomText("Hello"))
+        div.append(span)
+
+        copied = deep_copy_with_metadata(div)
+
+        assert _tags(copied) == ["div", "span"]
+        assert copied.children[0].children[0].content == "Hello"
+
+    def test_copy_does_not_share_dicts(self):
+        """Test that changing the copy's attributes or styles leaves the source alone."""
+        div = Node(tag="div", attrib={"a": "1"}, styles={"display": "block"})
+
+        copied = deep_copy_with_metadata(div)
+        copied.attrib["a"] = "2"
+        copied.styles["display"] = "none"
+
+        assert div.attrib == {"a": "1"}
+        assert div.styles == {"display": "block"}
+
+
+class TestFilterVisibility:
+    """Test fused visibility filter."""
+
+    def test_removes_hidden_elements(self, hidden_elements_html):
+        """Test that non-visible tags and CSS-hidden elements are removed."""
+        filtered = filter_visibility(parse_html(hidden_elements_html))
+
+        tags = set(_tags(filtered))
+
+        assert tags.isdisjoint({"script", "style", "head", "div"})
+        assert {"html", "body", "p"} <= tags
+
+    def test_respects_disabled_passes(self, hidden_elements_html):
+        """Test that disabled passes keep their elements."""
+        filtered = filter_visibility(
+            parse_html(hidden_elements_html), non_visible_tags=False, css_hidden=False
+        )
+
+        tags = _tags(filtered)
+
+        assert "script" in tags
+        assert tags.count("div") == 2
+
+    def test_keeps_zero_dimension_container_with_children(self):
+        """Test that zero-size containers survive when they have visible children."""
+        root = Node(tag="div")
+        popup = Node(tag="div", bounds=BoundingBox(0, 0, 0, 0))
+        popup.append(Node(tag="button", bounds=BoundingBox(0, 0, 10, 10)))
+        empty = Node(tag="span", bounds=BoundingBox(0, 0, 0, 0))
+        empty.append(Text("text only"))
+        root.append(popup)
+        root.append(empty)
+
+        filtered = filter_visibility(root)
+
+        assert _tags(filtered) == ["div", "div", "button"]
+
+    def test_removes_root(self):
+        """Test that a hidden root returns None."""
+        root = Node(tag="div", styles={"display": "none"})
+
+        assert filter_visibility(root) is None
+
+    def test_records_original_node(self):
+        """Test that copies reference the node they were copied from."""
+        root = Node(tag="div")
+        button = Node(tag="button")
+        root.append(button)
+
+        filtered = filter_visibility(root)
+
+        assert filtered.metadata["original_node"] is root
+        assert filtered.children[0].metadata["original_node"] is button
+
+    def test_does_not_modify_input(self, hidden_elements_html):
+        """Test that the input tree is left untouched."""
+        root = parse_html(hidden_elements_html)
+        before = _tags(root)
+
+        filter_visibility(root)
+
+        assert _tags(root) == before
+
+
+class TestCleanAttributesInPlace:
+    """Test in-place attribute cleaning."""
+
+    def test_keeps_only_given_attributes(self):
+        """Test that attributes outside the keep set are dropped."""
+        root = Node(tag="div", attrib={"class": "nav", "role": "navigation"})
+        link = Node(tag="a", attrib={"href": "/home", "title": "Home"})
+        root.append(link)
+
+        clean_attributes_in_place(root, {"role", "href", "title"})
+
+        assert root.attrib == {"role": "navigation"}
+        assert link.attrib == {"href": "/home", "title": "Home"}
+
+    def test_removes_presentational_role(self):
+        """Test that role=none/presentation is removed even when keeping all attributes."""
+        attrib = {"role": "Presentation", "class": "list"}
+        root = Node(tag="ul", attrib=attrib)
+
+        clean_attributes_in_place(root)
+
+        assert root.attrib == {"class": "list"}
+        assert attrib == {"role": "Presentation", "class": "list"}
+
+    def test_result_does_not_share_attributes(self):
+        """Test that filtered copies own their attributes, even with every filter off."""
+        root = Node(tag="body")
+        link = Node(tag="a", attrib={"href": "/home"})
+        root.append(link)
+
+        filtered = apply_filters_with_original(
+            root,
+            filter_non_visible_tags=False,
+            filter_css_hidden=False,
+            filter_zero_dimensions=False,
+            filter_attributes_flag=False,
+            filter_empty_flag=False,
+            collapse_wrappers_flag=False,
+        )
+        filtered.children[0].attrib["href"] = "/changed"
+
+        assert link.attrib == {"href": "/home"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
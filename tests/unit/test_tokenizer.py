@@ -2,7 +2,7 @@
 
 import pytest
 
-from domcontext.tokenizer import TiktokenTokenizer, Tokenizer
+from domcontext.tokenizer import TiktokenTokenizer, Tokenizer, _get_encoding
 
 
 class MockTokenizer(Tokenizer):
@@ -13,6 +13,18 @@ class MockTokenizer(Tokenizer):
         return len(text.split())
 
 
+@pytest.fixture
+def fresh_encoding_cache():
+    """Empty the shared encoding cache before and after the test.
+
+    Clearing in teardown keeps a mocked encoding from leaking into later tests,
+    even when the test fails.
+    """
+    _get_encoding.cache_clear()
+    yield
+    _get_encoding.cache_clear()
+
+
 class TestTokenizerInterface:
     """Test Tokenizer abstract interface."""
 
@@ -29,6 +41,14 @@ class TestTokenizerInterface:
 
         assert count == 2
 
+    def test_default_batch_uses_count_tokens(self):
+        """Test that the default batch implementation counts each text."""
+        tokenizer = MockTokenizer()
+
+        counts = tokenizer.count_tokens_batch(["hello world", "", "one"])
+
+        assert counts == [2, 0, 1]
+
 
 class TestTiktokenTokenizer:
     """Test TiktokenTokenizer implementation."""
@@ -46,6 +66,33 @@ class TestTiktokenTokenizer:
 
         assert tokenizer is not None
 
+    @pytest.mark.parametrize("n_texts", [3, 1000])
+    def test_batch_matches_single(self, mocker, n_texts):
+        """Test that batch counting agrees with per-text counting, small or parallel."""
+        enc = mocker.patch("domcontext.tokenizer._get_encoding").return_value
+        enc.encode_ordinary.side_effect = lambda text: text.split()
+        enc.encode_ordinary_batch.side_effect = lambda texts, num_threads: [
+            text.split() for text in texts
+        ]
+        tokenizer = TiktokenTokenizer()
+        texts = [f"- div-{i}\n  - \"item {'word ' * (i % 7)}\"" for i in range(n_texts)]
+
+        counts = tokenizer.count_tokens_batch(texts)
+
+        assert counts == [tokenizer.count_tokens(text) for text in texts]
+        # Small batches skip the thread pool
+        assert enc.encode_ordinary_batch.called == (n_texts >= 512)
+
+    def test_reuses_encoding_across_instances(self, mocker, fresh_encoding_cache):
+        """Test that encodings are loaded once and shared between instances."""
+        get_encoding = mocker.patch("domcontext.tokenizer.tiktoken.get_encoding")
+
+        tokenizer1 = TiktokenTokenizer()
+        tokenizer2 = TiktokenTokenizer()
+
+        assert tokenizer1._enc is tokenizer2._enc
+        get_encoding.assert_called_once_with("cl100k_base")
+
     def test_counts_simple_text(self):
         """Test counting tokens in simple text."""
         tokenizer = TiktokenTokenizer()
@@ -93,6 +140,14 @@ class TestTiktokenTokenizer:
 
         assert count > 0
 
+    def test_counts_special_token_text(self):
+        """Test that special-token strings in page text are counted as plain text."""
+        tokenizer = TiktokenTokenizer()
+
+        count = tokenizer.count_tokens('- p-1\n  - "<|endoftext|>"')
+
+        assert count > 1
+
     def test_consistent_results(self):
         """Test that counting same text gives consistent results."""
         tokenizer = TiktokenTokenizer()